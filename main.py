@@ -1,8 +1,23 @@
+import asyncio
+import hmac
 import os
+import time
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import List, Optional, Literal
-
-from fastapi import FastAPI, Depends, Header, HTTPException, status
+from functools import lru_cache, wraps
+from itertools import cycle
+from operator import attrgetter
+from hashlib import blake2b
+from typing import Any, Callable, List, Literal, Optional
+
+import cbor2
+from cachetools import TTLCache
+import msgpack
+import orjson
+from fastapi import FastAPI, Request, Response, status
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
@@ -10,20 +25,199 @@ load_dotenv()
 
 API_KEY = os.getenv("API_KEY", "dev-key-change-me")
 
-# -------- Security (simple API key in header) --------
-def require_api_key(x_api_key: str = Header(default=None, alias="X-API-Key")):
-    if not x_api_key or x_api_key != API_KEY:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or missing API key")
-    return True
+# -------- Security (simple API key in header, checked before routing) --------
+_UNAUTHORIZED_BODY = orjson.dumps({"detail": "Invalid or missing API key"})
+_UNAUTHORIZED_START = {
+    "type": "http.response.start",
+    "status": status.HTTP_401_UNAUTHORIZED,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode()),
+    ],
+}
+
+class APIKeyMiddleware:
+    """Rejects HTTP requests without a valid X-API-Key header; paths in public_paths pass through."""
+
+    def __init__(self, app, key: str, public_paths=()):
+        self.app = app
+        self._key = key.encode()
+        self._public_paths = frozenset(public_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self._public_paths:
+            return await self.app(scope, receive, send)
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                if hmac.compare_digest(value, self._key):
+                    return await self.app(scope, receive, send)
+                break
+        await send(_UNAUTHORIZED_START)
+        await send({"type": "http.response.body", "body": _UNAUTHORIZED_BODY})
+
+# -------- Serialization (orjson by default; CBOR / MessagePack on request) --------
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+class CBORResponse(Response):
+    media_type = "application/cbor"
+
+    def render(self, content: Any) -> bytes:
+        return cbor2.dumps(content)
+
+class MsgPackResponse(Response):
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+# media types a client can ask for in Accept; JSON is served unless one of these has a strictly higher q
+_BINARY_RESPONSES = {
+    "application/cbor": CBORResponse,
+    "application/msgpack": MsgPackResponse,
+    "application/x-msgpack": MsgPackResponse,
+    "application/vnd.msgpack": MsgPackResponse,
+}
+
+def _responses(model) -> dict:
+    # documents the 200 body in OpenAPI; with no response_model the handler's dict is rendered as-is
+    return {200: {"model": model, "content": {"application/cbor": {}, "application/msgpack": {}}}}
+
+def _parse_accept(accept: str):
+    ranges = []
+    for part in accept.split(","):
+        media_range, *params = part.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        ranges.append((media_range.strip().lower(), q))
+    return ranges
+
+def _accept_q(ranges, media_type: str) -> float:
+    # q of the most specific matching range (exact > type/* > */*); 0 when nothing matches
+    wildcard = media_type.split("/", 1)[0] + "/*"
+    best_specificity, best_q = -1, 0.0
+    for media_range, q in ranges:
+        if media_range == media_type:
+            specificity = 2
+        elif media_range == wildcard:
+            specificity = 1
+        elif media_range == "*/*":
+            specificity = 0
+        else:
+            continue
+        if specificity > best_specificity:
+            best_specificity, best_q = specificity, q
+    return best_q
+
+@lru_cache(maxsize=256)
+def _binary_response_class(accept: Optional[str]):
+    """Highest-q binary response class for an Accept header, or None for JSON (which wins ties)."""
+    if not accept:
+        return None
+    ranges = _parse_accept(accept)
+    best_class, best_q = None, _accept_q(ranges, "application/json")
+    for media_type, response_class in _BINARY_RESPONSES.items():
+        q = _accept_q(ranges, media_type)
+        if q > best_q:
+            best_class, best_q = response_class, q
+    return best_class
+
+class ORJSONRequest(Request):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI still answers 422 on bad JSON
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+def _rendered_by(call: Callable, response_class, status_code: Optional[int]) -> Callable:
+    # returning a Response makes FastAPI skip serialize_response / jsonable_encoder for the dict
+    @wraps(call)
+    async def endpoint(**kwargs):
+        content = await call(**kwargs)
+        if isinstance(content, Response):
+            return content
+        if status_code is None:
+            return response_class(content)
+        return response_class(content, status_code=status_code)
+
+    return endpoint
+
+class NegotiatedRoute(APIRoute):
+    """Decodes request bodies with orjson and encodes responses in the format named by Accept.
+
+    One FastAPI handler is built per response class up front, so a binary response is encoded
+    straight from the handler's return value rather than re-encoded from JSON. Async endpoints
+    without a response_model have their return value rendered directly by that class.
+    """
+
+    def get_route_handler(self) -> Callable:
+        default_class = self.response_class
+        # routers without an explicit default_response_class hand us an (unhashable) DefaultPlaceholder
+        json_class = default_class.value if isinstance(default_class, DefaultPlaceholder) else default_class
+        dependant = self.dependant
+        direct = self.response_field is None and asyncio.iscoroutinefunction(dependant.call)
+        handlers = {}
+        for response_class in (json_class, *set(_BINARY_RESPONSES.values())):
+            self.response_class = default_class if response_class is json_class else response_class
+            if direct:
+                self.dependant = replace(dependant, call=_rendered_by(dependant.call, response_class, self.status_code))
+            handlers[response_class] = super().get_route_handler()
+        self.response_class = default_class
+        self.dependant = dependant
+        json_handler = handlers[json_class]
+
+        async def route_handler(request: Request) -> Response:
+            handler = handlers.get(_binary_response_class(request.headers.get("accept")), json_handler)
+            response = await handler(ORJSONRequest(request.scope, request.receive))
+            response.headers.add_vary_header("Accept")
+            return response
+
+        return route_handler
 
 app = FastAPI(
     title="MindCanvas Teacher Actions",
     version="1.0.0",
     description="API for educational planning, assessment, and analytics actions used by MindCanvas.",
     contact={"name": "MindCanvas", "url": "https://chatgpt.com/g/g-6810c3ef6f90819186228fd4196113b3-mindcanvas"},
+    default_response_class=ORJSONResponse,
 )
-
-# --------- Models ---------
+app.router.route_class = NegotiatedRoute
+_PUBLIC_PATHS = frozenset({"/", app.openapi_url, app.docs_url, app.redoc_url, app.swagger_ui_oauth2_redirect_url})
+app.add_middleware(APIKeyMiddleware, key=API_KEY, public_paths=_PUBLIC_PATHS)
+
+_default_openapi = app.openapi
+
+def _openapi_with_api_key():
+    # the key is checked in middleware, so FastAPI can't infer it; declare it for /docs and GPT Action imports
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        schema.setdefault("components", {})["securitySchemes"] = {
+            "APIKeyHeader": {"type": "apiKey", "in": "header", "name": "X-API-Key"},
+        }
+        schema["security"] = [{"APIKeyHeader": []}]
+        for path in _PUBLIC_PATHS:
+            for operation in schema.get("paths", {}).get(path, {}).values():
+                operation["security"] = []
+    return app.openapi_schema
+
+app.openapi = _openapi_with_api_key
+
+# --------- Choice fields (allowed values for the Literal-typed request fields) ---------
+QUESTION_TYPES = ("mcq", "true_false", "short_answer")
+DIFFICULTIES = ("easy", "medium", "hard", "mixed")
+FRAMEWORKS = ("CCSS", "NGSS", "TEKS", "CA-ELA", "CA-Math", "Other")
+MODALITIES = ("in_person", "zoom", "phone")
+ASSESSMENT_TYPES = ("quiz", "project", "exit_ticket", "test", "other")
+ROLLUP_WINDOWS = ("unit", "quarter", "semester", "year")
+
+# --------- Models (requests validate with Pydantic; responses are documentation-only dataclasses) ---------
 class LessonPlanReq(BaseModel):
     subject: str
     grade_level: str
@@ -32,18 +226,20 @@ class LessonPlanReq(BaseModel):
     learning_objectives: Optional[List[str]] = None
     differentiation: Optional[bool] = False
 
-class LessonPlanResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LessonPlanResp:
     lesson_plan: dict
 
 class QuizReq(BaseModel):
     topic: str
     grade_level: Optional[str] = None
-    question_types: List[Literal["mcq", "true_false", "short_answer"]]
+    question_types: List[Literal[QUESTION_TYPES]]
     num_questions: int = Field(ge=1, le=50)
-    difficulty: Optional[Literal["easy", "medium", "hard", "mixed"]] = "mixed"
+    difficulty: Optional[Literal[DIFFICULTIES]] = "mixed"
     include_rationales: Optional[bool] = False
 
-class QuizResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class QuizResp:
     questions: List[dict]
     answer_key: List[str]
 
@@ -62,16 +258,18 @@ class GradeWithRubricReq(BaseModel):
     student_response: str
     max_total_points: Optional[float] = None
 
-class GradeWithRubricResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class GradeWithRubricResp:
     total_points: float
     criteria: List[dict]
     feedback: str
 
 class MapObjectivesReq(BaseModel):
-    frameworks: Optional[List[Literal["CCSS", "NGSS", "TEKS", "CA-ELA", "CA-Math", "Other"]]] = None
+    frameworks: Optional[List[Literal[FRAMEWORKS]]] = None
     objectives: List[str]
 
-class MapObjectivesResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MapObjectivesResp:
     mappings: List[dict]
 
 class AvailabilityBlock(BaseModel):
@@ -81,11 +279,12 @@ class AvailabilityBlock(BaseModel):
 class ScheduleConferenceReq(BaseModel):
     student_name: str
     guardians: List[str]
-    preferred_modalities: Optional[List[Literal["in_person", "zoom", "phone"]]] = None
+    preferred_modalities: Optional[List[Literal[MODALITIES]]] = None
     teacher_availability_blocks: List[AvailabilityBlock]
     language: Optional[str] = "English"
 
-class ScheduleConferenceResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ScheduleConferenceResp:
     proposals: List[dict]
     invite_draft: str
 
@@ -94,15 +293,16 @@ class ProgressEntry(BaseModel):
     standard: str
     score: float = Field(ge=0)
     max_score: float = Field(gt=0)
-    assessment_type: Optional[Literal["quiz", "project", "exit_ticket", "test", "other"]] = "other"
+    assessment_type: Optional[Literal[ASSESSMENT_TYPES]] = "other"
     notes: Optional[str] = None
 
 class TrackProgressReq(BaseModel):
     student_id: str
     entries: List[ProgressEntry]
-    rollup_window: Optional[Literal["unit", "quarter", "semester", "year"]] = "unit"
+    rollup_window: Optional[Literal[ROLLUP_WINDOWS]] = "unit"
 
-class TrackProgressResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TrackProgressResp:
     mastery: List[dict]
 
 class AnalyzeExitReq(BaseModel):
@@ -111,26 +311,92 @@ class AnalyzeExitReq(BaseModel):
     num_groups: Optional[int] = Field(default=3, ge=2, le=8)
     return_exemplars_per_group: Optional[int] = Field(default=1, ge=0, le=5)
 
-class AnalyzeExitResp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AnalyzeExitResp:
     groups: List[dict]
     misconceptions: List[str]
 
+# --------- Static templates (built once; shared across responses, never mutate) ---------
+_DEFAULT_OBJECTIVES = ("Students will ...",)
+_SEQUENCE_HEAD = (
+    {"phase": "Do Now", "minutes": 5, "activity": "Warm-up prompt"},
+    {"phase": "Mini-lesson", "minutes": 15, "activity": "Direct instruction"},
+    {"phase": "Guided Practice", "minutes": 20, "activity": "Partner work"},
+)
+_SEQUENCE_TAIL = (
+    {"phase": "Exit Ticket", "minutes": 5, "activity": "Quick check"},
+)
+_DIFFERENTIATION = {
+    enabled: {"enabled": enabled, "notes": "Scaffolds and extensions suggested."} for enabled in (False, True)
+}
+_MATERIALS = ("Projector", "Slides", "Handout")
+_ASSESSMENT = {"type": "exit_ticket", "criteria": ("Accuracy", "Reasoning")}
+
+_ROOT_BODY = orjson.dumps({"status": "ok", "service": "MindCanvas Teacher Actions"})
+
 # --------- Helpers (toy logic; replace with real) ---------
+# isoformat() is comparatively slow; requests within the same millisecond share one string
+# (abs() so a backwards wall-clock step refreshes immediately instead of pinning the old value)
+_cached_iso: tuple[float, str] = (0.0, "")
+
 def now_iso():
-    return datetime.now(timezone.utc).isoformat()
+    global _cached_iso
+    t = time.time()
+    if abs(t - _cached_iso[0]) > 0.001:
+        _cached_iso = (t, datetime.fromtimestamp(t, timezone.utc).isoformat())
+    return _cached_iso[1]
+
+_MCQ_CHOICES = ("A", "B", "C", "D")
+_level_points = attrgetter("points")
 
+# cached per (i, topic): the returned dict is shared between responses, so callers must not mutate it
+@lru_cache(maxsize=2048)
 def simple_mcq(i: int, topic: str):
     return {
         "id": f"Q{i+1}",
         "type": "mcq",
         "stem": f"Which statement about {topic} is correct?",
-        "choices": ["A", "B", "C", "D"],
+        "choices": _MCQ_CHOICES,
         "answer": "A",
     }
 
+def _mcq(i: int, topic: str):
+    q = simple_mcq(i, topic)
+    return q, q["answer"]
+
+def _true_false(i: int, topic: str):
+    return {"id": f"Q{i+1}", "type": "true_false", "stem": f"{topic}: True or False?", "answer": True}, "True"
+
+def _short_answer(i: int, topic: str):
+    return {"id": f"Q{i+1}", "type": "short_answer", "stem": f"Briefly explain {topic}."}, "<free-response>"
+
+# question type -> (question, answer key entry) generator; keys match QUESTION_TYPES
+_QGEN = {"mcq": _mcq, "true_false": _true_false, "short_answer": _short_answer}
+
+def cached_json(ttl: int = 3600, maxsize: int = 10_000):
+    """Memoize an async handler whose result depends only on its request body.
+
+    Keys are a blake2b digest of the body's canonical (sorted-key) JSON. Cached results are
+    shared between responses and must not be mutated.
+    """
+    def decorator(handler):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+        @wraps(handler)
+        async def wrapper(body: BaseModel):
+            key = blake2b(orjson.dumps(body.model_dump(), option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+            result = cache.get(key)
+            if result is None:
+                result = cache[key] = await handler(body)
+            return result
+
+        return wrapper
+
+    return decorator
+
 # --------- Endpoints ---------
-@app.post("/create-lesson-plan", response_model=LessonPlanResp, dependencies=[Depends(require_api_key)])
-def create_lesson_plan(body: LessonPlanReq):
+@app.post("/create-lesson-plan", responses=_responses(LessonPlanResp))
+async def create_lesson_plan(body: LessonPlanReq):
     plan = {
         "meta": {
             "generated_at": now_iso(),
@@ -139,45 +405,37 @@ def create_lesson_plan(body: LessonPlanReq):
             "duration_minutes": body.duration_minutes,
             "standards": body.standards or [],
         },
-        "objectives": body.learning_objectives or ["Students will ..."],
-        "materials": ["Projector", "Slides", "Handout"],
+        "objectives": body.learning_objectives or _DEFAULT_OBJECTIVES,
+        "materials": _MATERIALS,
         "sequence": [
-            {"phase": "Do Now", "minutes": 5, "activity": "Warm-up prompt"},
-            {"phase": "Mini-lesson", "minutes": 15, "activity": "Direct instruction"},
-            {"phase": "Guided Practice", "minutes": 20, "activity": "Partner work"},
+            *_SEQUENCE_HEAD,
             {"phase": "Independent Practice", "minutes": body.duration_minutes - 45, "activity": "Task"},
-            {"phase": "Exit Ticket", "minutes": 5, "activity": "Quick check"},
+            *_SEQUENCE_TAIL,
         ],
-        "assessment": {"type": "exit_ticket", "criteria": ["Accuracy", "Reasoning"]},
-        "differentiation": {"enabled": bool(body.differentiation), "notes": "Scaffolds and extensions suggested."},
+        "assessment": _ASSESSMENT,
+        "differentiation": _DIFFERENTIATION[bool(body.differentiation)],
     }
     return {"lesson_plan": plan}
 
-@app.post("/generate-quiz", response_model=QuizResp, dependencies=[Depends(require_api_key)])
-def generate_quiz(body: QuizReq):
+@app.post("/generate-quiz", responses=_responses(QuizResp))
+@cached_json()
+async def generate_quiz(body: QuizReq):
     qs = []
     ak = []
-    for i in range(body.num_questions):
-        qt = body.question_types[i % len(body.question_types)]
-        if qt == "mcq":
-            q = simple_mcq(i, body.topic)
-            qs.append(q)
-            ak.append(q["answer"])
-        elif qt == "true_false":
-            qs.append({"id": f"Q{i+1}", "type": "true_false", "stem": f"{body.topic}: True or False?", "answer": True})
-            ak.append("True")
-        else:  # short_answer
-            qs.append({"id": f"Q{i+1}", "type": "short_answer", "stem": f"Briefly explain {body.topic}."})
-            ak.append("<free-response>")
+    topic = body.topic
+    for i, qt in zip(range(body.num_questions), cycle(body.question_types)):
+        q, answer = _QGEN[qt](i, topic)
+        qs.append(q)
+        ak.append(answer)
     return {"questions": qs, "answer_key": ak}
 
-@app.post("/grade-with-rubric", response_model=GradeWithRubricResp, dependencies=[Depends(require_api_key)])
-def grade_with_rubric(body: GradeWithRubricReq):
+@app.post("/grade-with-rubric", responses=_responses(GradeWithRubricResp))
+async def grade_with_rubric(body: GradeWithRubricReq):
     # naive scoring: pick highest level per criterion * weight
     total = 0.0
     details = []
     for c in body.rubric:
-        top = max(c.levels, key=lambda lvl: lvl.points)
+        top = max(c.levels, key=_level_points)
         pts = top.points * (c.weight or 1.0)
         total += pts
         details.append({"criterion": c.criterion, "selected_level": top.label, "points_awarded": pts})
@@ -186,16 +444,16 @@ def grade_with_rubric(body: GradeWithRubricReq):
     feedback = "Good structure; consider adding more specific evidence."
     return {"total_points": total, "criteria": details, "feedback": feedback}
 
-@app.post("/map-objectives-to-standards", response_model=MapObjectivesResp, dependencies=[Depends(require_api_key)])
-def map_objectives_to_standards(body: MapObjectivesReq):
+@app.post("/map-objectives-to-standards", responses=_responses(MapObjectivesResp))
+async def map_objectives_to_standards(body: MapObjectivesReq):
     fw = body.frameworks or ["CCSS"]
     mappings = []
     for obj in body.objectives:
         mappings.append({"objective": obj, "framework": fw[0], "suggested_standard": "RL.5.2", "confidence": 0.72})
     return {"mappings": mappings}
 
-@app.post("/schedule-parent-conference", response_model=ScheduleConferenceResp, dependencies=[Depends(require_api_key)])
-def schedule_parent_conference(body: ScheduleConferenceReq):
+@app.post("/schedule-parent-conference", responses=_responses(ScheduleConferenceResp))
+async def schedule_parent_conference(body: ScheduleConferenceReq):
     proposals = []
     for blk in body.teacher_availability_blocks[:3]:
         proposals.append({
@@ -203,34 +461,61 @@ def schedule_parent_conference(body: ScheduleConferenceReq):
             "end_iso": blk.end_iso,
             "modality": (body.preferred_modalities or ["zoom"])[0],
         })
-    invite = (
-        f"Hello {', '.join(body.guardians)},\n\n"
-        f"I'd like to meet regarding {body.student_name}. Here are some proposed times:\n"
-        + "\n".join([f"- {p['start_iso']} to {p['end_iso']} ({p['modality']})" for p in proposals])
-        + "\n\nBest,\nMindCanvas"
-    )
+    invite = "\n".join([
+        f"Hello {', '.join(body.guardians)},",
+        "",
+        f"I'd like to meet regarding {body.student_name}. Here are some proposed times:",
+        *[f"- {p['start_iso']} to {p['end_iso']} ({p['modality']})" for p in proposals],
+        "",
+        "Best,",
+        "MindCanvas",
+    ])
     return {"proposals": proposals, "invite_draft": invite}
 
-@app.post("/track-student-progress", response_model=TrackProgressResp, dependencies=[Depends(require_api_key)])
-def track_student_progress(body: TrackProgressReq):
-    # naive rollup by standard: % correct
+@app.post("/track-student-progress", responses=_responses(TrackProgressResp))
+async def track_student_progress(body: TrackProgressReq):
+    # naive rollup by standard: % correct, as a running [sum, count] per standard
     by_std = {}
     for e in body.entries:
         pct = e.score / e.max_score
-        by_std.setdefault(e.standard, []).append(pct)
-    mastery = [{"standard": s, "avg_mastery": round(sum(v) / len(v), 3), "samples": len(v)} for s, v in by_std.items()]
+        acc = by_std.get(e.standard)
+        if acc is None:
+            by_std[e.standard] = [pct, 1]
+        else:
+            acc[0] += pct
+            acc[1] += 1
+    mastery = [{"standard": s, "avg_mastery": round(t / n, 3), "samples": n} for s, (t, n) in by_std.items()]
     return {"mastery": mastery}
 
-@app.post("/analyze-exit-tickets", response_model=AnalyzeExitResp, dependencies=[Depends(require_api_key)])
-def analyze_exit_tickets(body: AnalyzeExitReq):
-    # toy clustering by length parity
+@app.post("/analyze-exit-tickets", responses=_responses(AnalyzeExitResp))
+async def analyze_exit_tickets(body: AnalyzeExitReq):
+    # toy clustering by length parity, partitioned in a single pass
+    concise = []
+    detailed = []
+    ca = concise.append
+    da = detailed.append
+    for r in body.responses:
+        (ca if len(r) < 50 else da)(r)
     groups = [
-        {"group": 1, "label": "Concise", "responses": [r for r in body.responses if len(r) < 50]},
-        {"group": 2, "label": "Detailed", "responses": [r for r in body.responses if len(r) >= 50]},
+        {"group": 1, "label": "Concise", "responses": concise},
+        {"group": 2, "label": "Detailed", "responses": detailed},
     ]
     misconceptions = ["Confuses chlorophyll with sugar synthesis"]
     return {"groups": groups, "misconceptions": misconceptions}
 
 @app.get("/", include_in_schema=False)
-def root():
-    return {"status": "ok", "service": "MindCanvas Teacher Actions", "time": now_iso()}
+async def root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # production settings: uvloop event loop + httptools parser, one worker per core
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
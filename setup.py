@@ -0,0 +1,23 @@
+"""Optional build step: compile main.py into a C extension with Cython.
+
+`make build` writes main.cpython-*.so next to main.py. Python's import system
+prefers the extension over the source file, so `uvicorn main:app` picks it up
+unchanged; without it the interpreted main.py is used as before.
+"""
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="mindcanvas-api",
+    ext_modules=cythonize(
+        "main.py",
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            # FastAPI and Pydantic introspect signatures and annotations at runtime
+            "binding": True,
+            "annotation_typing": False,
+        },
+    ),
+)